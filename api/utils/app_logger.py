@@ -3,6 +3,7 @@ Centralized logger configuration for the entire application.
 This ensures all parts of the app (Flask, scheduler, background tasks) use the same logger.
 """
 import os
+from functools import lru_cache
 from loguru import logger as loguru_logger
 from .logger_manager import LoggerManager
 
@@ -42,10 +43,12 @@ def get_app_logger():
     
     return _logger
 
+@lru_cache(maxsize=128)
 def get_task_logger(task_name: str):
     """
     Get a logger instance for a specific background task.
     This adds task context to all log messages.
+    The bound logger is cached per task name, since its context never changes.
     
     Args:
         task_name: Name of the background task
@@ -67,6 +70,13 @@ def cleanup_logger():
         _log_manager.cleanup()
         _log_manager = None
         _logger = None
+        get_task_logger.cache_clear()
 
-# Create a convenience alias
-logger = get_app_logger()
\ No newline at end of file
+def __getattr__(name):
+    """
+    Resolve the `logger` convenience alias lazily (PEP 562), so importing
+    this module doesn't create log files or sinks until logging is needed.
+    """
+    if name == "logger":
+        return get_app_logger()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
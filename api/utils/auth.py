@@ -1,32 +1,31 @@
 """
 Authentication and authorization utilities
 """
-from flask import request, jsonify
+from flask import request, g, Response
 from functools import wraps
+import json
 import platform
 import os
 from loguru import logger
+from .logger_manager import log_timed_call
+
+# Process-constant environment facts, resolved once at import
+_NODE_IS_DESKTOP = platform.node().upper().startswith('DESKTOP')  # Home development environment
+_FLASK_DEV = os.environ.get('FLASK_ENV') == 'development' or os.environ.get('FLASK_DEBUG') == '1'
+_DUMMY_MODE = os.environ.get('DATA_SOURCE_MODE') == 'dummy'
+_LOCALHOST = frozenset({'127.0.0.1', 'localhost', '::1'})
 
 def is_development_environment():
     """
     Check if we're in development environment
     Returns True if running in development mode
     """
-    # Check if DATA_SOURCE_MODE is set to dummy and request is from localhost
-    data_source_mode = os.environ.get('DATA_SOURCE_MODE')
-    if data_source_mode == 'dummy':
-        # Check if request is from localhost/127.0.0.1
-        remote_addr = request.environ.get('REMOTE_ADDR', '')
-        if remote_addr in ['127.0.0.1', 'localhost', '::1']:
-            return True
-    
-    # Check if running in development mode based on platform
-    node_name = platform.node().upper()
-    if node_name.startswith('DESKTOP'):
-        return True  # Home development environment
+    # Platform / Flask debug mode never change for the process lifetime
+    if _NODE_IS_DESKTOP or _FLASK_DEV:
+        return True
     
-    # Check Flask debug mode
-    if os.environ.get('FLASK_ENV') == 'development' or os.environ.get('FLASK_DEBUG') == '1':
+    # DATA_SOURCE_MODE is dummy and request is from localhost/127.0.0.1
+    if _DUMMY_MODE and request.environ.get('REMOTE_ADDR', '') in _LOCALHOST:
         return True
     
     return False
@@ -36,9 +35,7 @@ def is_restricted_user(user_id):
     Check if user should be restricted based on their ID
     Returns True if user ID starts with 'X' or 'x'
     """
-    if not user_id:
-        return False
-    return user_id.lower().startswith('x')
+    return bool(user_id) and user_id[0] in ('x', 'X')
 
 def get_user_from_cookie():
     """
@@ -51,10 +48,20 @@ def check_user_access():
     """
     Check if current user has access to protected resources
     Returns tuple (has_access: bool, user_id: str)
+    The result is cached on flask.g for the rest of the request
     """
+    cached = g.get('_user_access')
+    if cached is not None:
+        return cached
+    
+    g._user_access = result = _resolve_user_access()
+    return result
+
+def _resolve_user_access():
+    """Uncached access check behind check_user_access"""
     # In development environment, bypass authentication
     if is_development_environment():
-        logger.info("Development environment detected - bypassing authentication")
+        logger.debug("Development environment detected - bypassing authentication")
         return True, "dev_user"
     
     user_id = get_user_from_cookie()
@@ -64,10 +71,20 @@ def check_user_access():
     
     has_access = not is_restricted_user(user_id)
     if not has_access:
-        logger.info(f"Access denied for restricted user: {user_id}")
+        logger.info("Access denied for restricted user: {user_id}", user_id=user_id)
     
     return has_access, user_id
 
+# 403 body serialized once instead of per denied request
+_DENIED_BODY = json.dumps({
+    'error': 'Access denied',
+    'message': 'You do not have permission to access this resource'
+})
+
+def _denied():
+    """Build the 403 response for restricted users"""
+    return Response(_DENIED_BODY, status=403, mimetype='application/json')
+
 def require_access(f):
     """
     Decorator to protect routes from restricted users
@@ -77,11 +94,34 @@ def require_access(f):
         has_access, user_id = check_user_access()
         
         if not has_access:
-            return jsonify({
-                'error': 'Access denied',
-                'message': 'You do not have permission to access this resource'
-            }), 403
+            return _denied()
         
         return f(*args, **kwargs)
     
-    return decorated_function
\ No newline at end of file
+    return decorated_function
+
+def protected_and_logged(include_args=False, log_exceptions=True):
+    """
+    Decorator combining require_access with LoggerManager.log_performance
+    timing (both via log_timed_call) in a single decorator
+    
+    Usage:
+        @app.route('/api/data')
+        @protected_and_logged()
+        def get_data():
+            ...
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            has_access, user_id = check_user_access()
+            
+            if not has_access:
+                return _denied()
+            
+            return log_timed_call(f, args, kwargs,
+                                  include_args=include_args, log_exceptions=log_exceptions)
+        
+        return decorated_function
+    
+    return decorator
@@ -1,4 +1,5 @@
-from datetime import datetime
+from datetime import datetime, date
+from functools import lru_cache
 from dateutil import parser
 from dateutil.relativedelta import relativedelta
 from typing import Optional, Union
@@ -27,28 +28,58 @@ def parse_date_string(
     # Clean up the input string
     date_string = date_string.strip()
     
-    # Handle relative dates first
+    # Canonical ISO-8601 / YYYYMMDD strings skip dateutil entirely
+    dt = _parse_iso_date(date_string)
+    if dt:
+        if not include_microseconds:
+            dt = dt.replace(microsecond=0)
+        return dt.isoformat() if return_iso else dt
+    
+    # Handle relative dates (time-dependent, never cached)
     relative_dt = parse_relative_date(date_string)
     if relative_dt:
         if not include_microseconds:
             relative_dt = relative_dt.replace(microsecond=0)
         return relative_dt.isoformat() if return_iso else relative_dt
     
+    # Absolute parses are memoized; keyed on today's date because dateutil
+    # fills missing components ("Jan 15", "15:30") from the current day
+    return _parse_date_string_cached(date_string, return_iso, include_microseconds, date.today())
+
+
+_DIGIT_RE = re.compile(r'\d')
+
+# Shared dateutil parser (default parserinfo), called directly
+_DEFAULT_PARSER = parser.parser()
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_string_cached(
+    date_string: str,
+    return_iso: bool,
+    include_microseconds: bool,
+    today: date
+) -> Optional[Union[datetime, str]]:
+    """dateutil-backed part of parse_date_string (no relative dates)."""
     # Try dateutil parser
     try:
         # Common date hints for ambiguous formats
         # Set dayfirst=True for European format (DD/MM/YYYY)
         # You can change this based on your primary user base
-        dt = parser.parse(date_string, fuzzy=True, dayfirst=False)
+        dt = _DEFAULT_PARSER.parse(date_string, fuzzy=True, dayfirst=False)
         if not include_microseconds:
             dt = dt.replace(microsecond=0)
         return dt.isoformat() if return_iso else dt
     except (parser.ParserError, ValueError):
         pass
     
-    # Try with dayfirst=True for European formats
+    # Try with dayfirst=True for European formats; without any digits there is
+    # no day/month to reinterpret, so skip the second parse
+    if not _DIGIT_RE.search(date_string):
+        return None
+    
     try:
-        dt = parser.parse(date_string, fuzzy=True, dayfirst=True)
+        dt = _DEFAULT_PARSER.parse(date_string, fuzzy=True, dayfirst=True)
         if not include_microseconds:
             dt = dt.replace(microsecond=0)
         return dt.isoformat() if return_iso else dt
@@ -58,44 +89,70 @@ def parse_date_string(
     return None
 
 
+# Simple relative dates, mapped to (relativedelta unit, sign)
+_NOW_KEYS = frozenset({'today', 'now'})
+_REL_OFFSETS = {
+    'yesterday': ('days', -1),
+    'tomorrow': ('days', 1),
+    'last week': ('weeks', -1),
+    'next week': ('weeks', 1),
+    'last month': ('months', -1),
+    'next month': ('months', 1),
+    'last year': ('years', -1),
+    'next year': ('years', 1),
+}
+
+# "X days/weeks/months/years ago" or "in X days/weeks/months/years"
+_REL_PATTERNS = [
+    (re.compile(r'(\d+)\s*days?\s*ago'), 'days', -1),
+    (re.compile(r'(\d+)\s*weeks?\s*ago'), 'weeks', -1),
+    (re.compile(r'(\d+)\s*months?\s*ago'), 'months', -1),
+    (re.compile(r'(\d+)\s*years?\s*ago'), 'years', -1),
+    (re.compile(r'in\s*(\d+)\s*days?'), 'days', 1),
+    (re.compile(r'in\s*(\d+)\s*weeks?'), 'weeks', 1),
+    (re.compile(r'in\s*(\d+)\s*months?'), 'months', 1),
+    (re.compile(r'in\s*(\d+)\s*years?'), 'years', 1),
+]
+
+
+def _parse_iso_date(date_string: str) -> Optional[datetime]:
+    """Parse 'YYYY-MM-DD[THH:MM:SS[Z]]' and 'YYYYMMDD' strings without dateutil."""
+    if len(date_string) == 8 and date_string.isdigit():
+        try:
+            return datetime(int(date_string[:4]), int(date_string[4:6]), int(date_string[6:]))
+        except ValueError:
+            return None
+    
+    # Only 'YYYY-MM-DD' optionally followed by a ' '/'T' time: Python 3.11's
+    # fromisoformat also takes week/ordinal dates and arbitrary separators,
+    # which dateutil reads differently (or not at all)
+    n = len(date_string)
+    if n < 10 or date_string[4] != '-' or date_string[7] != '-' or (n > 10 and date_string[10] not in ' T'):
+        return None
+    
+    try:
+        return datetime.fromisoformat(date_string.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+
+
 def parse_relative_date(date_string: str) -> Optional[datetime]:
     """Parse relative date strings like 'today', 'yesterday', '3 days ago', etc."""
     date_string_lower = date_string.lower()
     now = datetime.now()
     
-    # Simple relative dates
-    relative_dates = {
-        'today': now,
-        'now': now,
-        'yesterday': now - relativedelta(days=1),
-        'tomorrow': now + relativedelta(days=1),
-        'last week': now - relativedelta(weeks=1),
-        'next week': now + relativedelta(weeks=1),
-        'last month': now - relativedelta(months=1),
-        'next month': now + relativedelta(months=1),
-        'last year': now - relativedelta(years=1),
-        'next year': now + relativedelta(years=1),
-    }
-    
-    if date_string_lower in relative_dates:
-        return relative_dates[date_string_lower]
-    
-    # Parse "X days/weeks/months/years ago" or "in X days/weeks/months/years"
-    patterns = [
-        (r'(\d+)\s*days?\s*ago', lambda x: now - relativedelta(days=int(x))),
-        (r'(\d+)\s*weeks?\s*ago', lambda x: now - relativedelta(weeks=int(x))),
-        (r'(\d+)\s*months?\s*ago', lambda x: now - relativedelta(months=int(x))),
-        (r'(\d+)\s*years?\s*ago', lambda x: now - relativedelta(years=int(x))),
-        (r'in\s*(\d+)\s*days?', lambda x: now + relativedelta(days=int(x))),
-        (r'in\s*(\d+)\s*weeks?', lambda x: now + relativedelta(weeks=int(x))),
-        (r'in\s*(\d+)\s*months?', lambda x: now + relativedelta(months=int(x))),
-        (r'in\s*(\d+)\s*years?', lambda x: now + relativedelta(years=int(x))),
-    ]
+    if date_string_lower in _NOW_KEYS:
+        return now
+    
+    offset = _REL_OFFSETS.get(date_string_lower)
+    if offset:
+        unit, sign = offset
+        return now + relativedelta(**{unit: sign})
     
-    for pattern, func in patterns:
-        match = re.search(pattern, date_string_lower)
+    for pattern, unit, sign in _REL_PATTERNS:
+        match = pattern.search(date_string_lower)
         if match:
-            return func(match.group(1))
+            return now + relativedelta(**{unit: sign * int(match.group(1))})
     
     return None
 
@@ -128,6 +185,15 @@ def parse_date_string_with_settings(
     
     date_string = date_string.strip()
     
+    # ISO fast path is only equivalent when dateutil wouldn't swap day/month
+    # or fill missing components from `default`
+    if not dayfirst and default is None:
+        dt = _parse_iso_date(date_string)
+        if dt:
+            if not include_microseconds:
+                dt = dt.replace(microsecond=0)
+            return dt.isoformat() if return_iso else dt
+    
     # Handle relative dates
     relative_dt = parse_relative_date(date_string)
     if relative_dt:
@@ -136,7 +202,7 @@ def parse_date_string_with_settings(
         return relative_dt.isoformat() if return_iso else relative_dt
     
     try:
-        dt = parser.parse(
+        dt = _DEFAULT_PARSER.parse(
             date_string, 
             fuzzy=True, 
             dayfirst=dayfirst,
@@ -152,6 +218,8 @@ def parse_date_string_with_settings(
 
 # Example usage and test cases
 if __name__ == "__main__":
+    import time
+    
     # Note: You need to install python-dateutil first:
     # pip install python-dateutil
     
@@ -184,13 +252,16 @@ if __name__ == "__main__":
     ]
     
     print("Testing various date formats with dateutil:\n")
-    for date_str in test_dates:
-        result = parse_date_string(date_str)
-        iso_result = parse_date_string(date_str, return_iso=True)
+    start = time.perf_counter()
+    results = [(date_str, parse_date_string(date_str)) for date_str in test_dates]
+    elapsed = time.perf_counter() - start
+    
+    for date_str, result in results:
         print(f"Input: '{date_str}'")
         print(f"DateTime: {result}")
-        print(f"ISO Format: {iso_result}")
+        print(f"ISO Format: {result.isoformat() if result else None}")
         print("-" * 50)
+    print(f"Parsed {len(test_dates)} dates in {elapsed * 1000:.2f} ms")
     
     # Test with different settings
     print("\n\nTesting with different settings:")
@@ -2,10 +2,448 @@ from loguru import logger
 import sys
 from pathlib import Path
 from typing import Optional, Any, Callable
+import atexit
 import builtins
 import json
-from datetime import datetime
+import os
+import re
+import socket
+import threading
+import time
+import traceback
+import weakref
+from collections import deque
+from datetime import datetime, timedelta
 from functools import wraps
+from loguru._string_parsers import parse_size, parse_duration
+
+try:
+    import orjson
+except ImportError:  # Optional: _serialize_record falls back to the stdlib json module
+    orjson = None
+
+
+def _format_call_args(args: tuple, kwargs: dict) -> str:
+    """Render call arguments for log_performance messages."""
+    arg_list = [repr(arg) for arg in args]
+    kwarg_list = [f"{k}={repr(v)}" for k, v in kwargs.items()]
+    return f" with args: ({', '.join(arg_list + kwarg_list)})"
+
+
+# loguru's INFO level number
+_INFO_NO = 20
+
+
+def _min_level_no() -> int:
+    """
+    Lowest level accepted by any loguru sink.
+
+    Read live from loguru's process-global core at each check: handlers added
+    by other managers or by direct logger.add() calls change it too.
+    """
+    try:
+        return logger._core.min_level
+    except AttributeError:
+        return 0
+
+
+def log_timed_call(func: Callable, args: tuple, kwargs: dict, *,
+                   include_args: bool = False, log_exceptions: bool = True) -> Any:
+    """
+    Call func(*args, **kwargs) and log how long it took (log_performance's body).
+
+    Records are attributed to the caller's frame, i.e. the decorator's wrapper.
+
+    Usage:
+        def wrapper(*args, **kwargs):
+            return log_timed_call(func, args, kwargs, include_args=True)
+    """
+    start_ns = time.perf_counter_ns()
+    try:
+        result = func(*args, **kwargs)
+    except Exception:
+        if log_exceptions:
+            duration_ns = time.perf_counter_ns() - start_ns
+            arg_str = _format_call_args(args, kwargs) if include_args else ""
+            logger.bind(duration_ns=duration_ns).opt(depth=1).exception(
+                f"Function '{func.__name__}'{arg_str} failed after {duration_ns / 1e9:.3f} seconds")
+        raise
+
+    duration_ns = time.perf_counter_ns() - start_ns
+    # Skip repr() of the arguments when INFO would be discarded anyway
+    if _min_level_no() <= _INFO_NO:
+        arg_str = _format_call_args(args, kwargs) if include_args else ""
+        logger.bind(duration_ns=duration_ns).opt(depth=1).info(
+            f"Function '{func.__name__}'{arg_str} executed successfully in {duration_ns / 1e9:.3f} seconds")
+    return result
+
+
+def _parse_or_none(parse: Callable, value: Any) -> Any:
+    """Apply a loguru string parser, returning None for non-matching values."""
+    if not isinstance(value, str):
+        return None
+    try:
+        return parse(value)
+    except ValueError:
+        return None
+
+
+def _serialize_record(message) -> str:
+    """
+    Serialize a loguru message to one JSON line in loguru's serialize=True layout.
+
+    "text" is the formatted message including any traceback, so JSON files keep
+    the same schema as serialize=True handlers whether or not orjson is installed.
+    """
+    record = message.record
+    exception = record["exception"]
+    if exception is not None:
+        exception = {
+            "type": None if exception.type is None else exception.type.__name__,
+            "value": exception.value,
+            "traceback": bool(exception.traceback),
+        }
+    payload = {
+        "text": str(message),
+        "record": {
+            "elapsed": {"repr": record["elapsed"], "seconds": record["elapsed"].total_seconds()},
+            "exception": exception,
+            "extra": record["extra"],
+            "file": {"name": record["file"].name, "path": record["file"].path},
+            "function": record["function"],
+            "level": {"icon": record["level"].icon, "name": record["level"].name, "no": record["level"].no},
+            "line": record["line"],
+            "message": record["message"],
+            "module": record["module"],
+            "name": record["name"],
+            "process": {"id": record["process"].id, "name": record["process"].name},
+            "thread": {"id": record["thread"].id, "name": record["thread"].name},
+            # loguru's datetime subclass isn't native to orjson (default=str would
+            # give a space-separated value), so format it as ISO-8601 explicitly
+            "time": {"repr": record["time"].isoformat(), "timestamp": record["time"].timestamp()},
+        },
+    }
+    if orjson is None:
+        return json.dumps(payload, default=str, ensure_ascii=False) + "\n"
+    # default=str covers Path, timedelta and other non-JSON values; datetimes are
+    # passed through to it too, so they render exactly as json.dumps(default=str)
+    # does (no "T", no invented offset on naive values)
+    return orjson.dumps(
+        payload,
+        default=str,
+        option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+    ).decode()
+
+
+def _report_sink_error(message: Any = None):
+    """Print the exception being handled to stderr, like loguru's catch=True."""
+    if sys.stderr is None:
+        return
+    try:
+        sys.stderr.write("--- Logging error in BatchedFileSink ---\n")
+        if message is not None:
+            sys.stderr.write(f"Record was: {getattr(message, 'record', message)!r}\n")
+        traceback.print_exc(file=sys.stderr)
+        sys.stderr.write("--- End of logging error ---\n")
+    except Exception:
+        pass
+
+
+# Max buffers per writev() call
+try:
+    _IOV_MAX = os.sysconf("SC_IOV_MAX")
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = 1024
+
+
+def _write_all(fd: int, chunks: list) -> int:
+    """Write byte chunks to fd with as few syscalls as possible; returns bytes written."""
+    total = 0
+    if not hasattr(os, "writev"):
+        view = memoryview(b"".join(chunks))
+        while view:
+            written = os.write(fd, view)
+            total += written
+            view = view[written:]
+        return total
+
+    for start in range(0, len(chunks), _IOV_MAX):
+        part = chunks[start:start + _IOV_MAX]
+        while part:
+            written = os.writev(fd, part)
+            total += written
+            # Drop fully written buffers and trim a partially written one
+            while part and written >= len(part[0]):
+                written -= len(part[0])
+                part.pop(0)
+            if part and written:
+                part[0] = part[0][written:]
+    return total
+
+
+# Live sinks, reset in forked children (see BatchedFileSink._after_fork)
+# and flushed at exit
+_BATCHED_SINKS = weakref.WeakSet()
+
+# Current process id, refreshed after fork (read by LoggerManager.pid)
+_PID = os.getpid()
+
+
+def _reset_sinks_after_fork():
+    global _PID
+    _PID = os.getpid()
+    for sink in list(_BATCHED_SINKS):
+        sink._after_fork()
+
+
+def _stop_sinks_at_exit():
+    # loguru only calls stop() on sinks it wraps itself, and the writer is a
+    # daemon thread, so queued records would otherwise die with the process
+    for sink in list(_BATCHED_SINKS):
+        try:
+            sink.stop()
+        except Exception:
+            _report_sink_error()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_sinks_after_fork)
+atexit.register(_stop_sinks_at_exit)
+
+
+class BatchedFileSink:
+    """
+    File sink that queues formatted records and writes them in batches.
+
+    Producers only append to an in-process deque; a single writer thread
+    drains it once `batch_size` records are pending or every `flush_interval`
+    seconds, and writes each batch with one write() call. It is thread-safe
+    on its own, so it's added with enqueue=False. Batches go to an O_APPEND
+    file descriptor in a single os.writev() (os.write() where unavailable).
+    Supports size-based rotation and age-based retention of rotated files.
+
+    Usage:
+        >>> sink = BatchedFileSink("logs/app.log", rotation=100 * 1024 ** 2)
+        >>> handler_id = logger.add(sink, format="{message}")  # doctest: +SKIP
+    """
+
+    def __init__(self, path, *,
+                 batch_size: int = 100,
+                 flush_interval: float = 1.0,
+                 rotation: Optional[float] = None,  # Max file size in bytes
+                 retention: Optional[timedelta] = None,  # Max age of rotated files
+                 serializer: Optional[Callable] = None):  # message -> line, replaces the formatted message
+        self.path = Path(path)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.rotation = rotation
+        self.retention = retention
+        self.serializer = serializer
+
+        # Unbounded on purpose: a maxlen would silently drop records
+        self._queue = deque()
+        self._wakeup = threading.Event()
+        self._write_lock = threading.Lock()
+        self._fd = None
+        self._size = 0
+        self._writer = None
+        self._stopped = False
+        _BATCHED_SINKS.add(self)
+
+    def _after_fork(self):
+        """Drop state inherited from the parent; the child starts its own writer."""
+        # The parent still writes the records queued before the fork
+        self._queue = deque()
+        self._wakeup = threading.Event()
+        self._write_lock = threading.Lock()
+        self._writer = None
+        if self._fd is not None:
+            try:
+                os.close(self._fd)
+            except OSError:
+                pass
+            self._fd = None
+
+    def __call__(self, message):
+        self._queue.append(message)
+        if len(self._queue) >= self.batch_size:
+            self._wakeup.set()
+        writer = self._writer
+        if writer is None or not writer.is_alive():
+            self._start_writer()
+
+    def _start_writer(self):
+        with self._write_lock:
+            if self._writer is None or not self._writer.is_alive():
+                self._stopped = False
+                self._writer = threading.Thread(target=self._run_writer,
+                                                name="BatchedFileSink", daemon=True)
+                self._writer.start()
+
+    def _run_writer(self):
+        while not self._stopped:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+
+    def _drain(self) -> list:
+        queue = self._queue
+        batch = []
+        try:
+            while True:
+                batch.append(queue.popleft())
+        except IndexError:
+            return batch
+
+    def _write_batch(self, batch: list):
+        """Write one batch; caller holds the write lock."""
+        serializer = self.serializer
+        chunks = []
+        for message in batch:
+            try:
+                line = serializer(message) if serializer is not None else message
+                chunks.append(line.encode("utf8"))
+            except Exception:
+                # Drop just this record, as loguru does for a failing sink call
+                _report_sink_error(message)
+        if not chunks:
+            return
+        if self._fd is None:
+            self._open()
+        rotation = self.rotation
+        if not rotation:
+            self._size += _write_all(self._fd, chunks)
+            return
+        # Check the limit before each record, as loguru's file sink does, so a
+        # large batch is split across files instead of overshooting one
+        start = 0
+        size = self._size
+        for i, chunk in enumerate(chunks):
+            if size and size + len(chunk) > rotation:
+                self._size += _write_all(self._fd, chunks[start:i])
+                self._rotate()
+                self._open()
+                start = i
+                size = self._size
+            size += len(chunk)
+        self._size += _write_all(self._fd, chunks[start:])
+
+    def _open(self):
+        flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT
+        try:
+            self._fd = os.open(self.path, flags, 0o644)
+        except FileNotFoundError:
+            # Log directory removed since setup: recreate it, as loguru's file sink does
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._fd = os.open(self.path, flags, 0o644)
+        self._size = os.fstat(self._fd).st_size
+
+    def _rotate(self):
+        """Move the current file aside (loguru naming) and prune old ones."""
+        os.close(self._fd)
+        self._fd = None
+        stamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S_%f")
+        target = self.path.with_name(f"{self.path.stem}.{stamp}{self.path.suffix}")
+        counter = 1
+        while target.exists():
+            # Several rotations within one batch can share a timestamp
+            counter += 1
+            target = self.path.with_name(f"{self.path.stem}.{stamp}.{counter}{self.path.suffix}")
+        self.path.rename(target)
+
+        if self.retention:
+            cutoff = time.time() - self.retention.total_seconds()
+            for old in self.path.parent.glob(f"{self.path.stem}.*{self.path.suffix}"):
+                try:
+                    if old.stat().st_mtime < cutoff:
+                        old.unlink()
+                except OSError:
+                    pass  # Removed concurrently
+
+    def flush(self):
+        """Write out any pending records; write errors are reported, not raised."""
+        with self._write_lock:
+            batch = self._drain()
+            if batch:
+                try:
+                    self._write_batch(batch)
+                except Exception:
+                    # Report and move on, so a full disk or unwritable file
+                    # doesn't kill the writer thread and stall later records
+                    _report_sink_error()
+
+    def stop(self):
+        """Stop the writer thread, write the tail and close the file."""
+        writer = self._writer
+        self._stopped = True
+        self._wakeup.set()
+        if writer is not None and writer is not threading.current_thread():
+            writer.join(timeout=max(self.flush_interval, 1.0) * 2)
+        self._writer = None
+        self.flush()
+        with self._write_lock:
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+
+
+class PreFilteredLogger:
+    """
+    Wrapper over the loguru logger that consults LoggerManager._pre_filter
+    before delegating, so rejected calls skip loguru's frame lookup, extra
+    merge and record construction entirely.
+
+    The manager's record-level filter still runs for accepted messages, since
+    only the message template (not the formatted text) is checked here.
+    """
+
+    __slots__ = ("_manager", "_logger")
+
+    # loguru's built-in level numbers
+    _TRACE, _DEBUG, _INFO, _SUCCESS, _WARNING, _ERROR, _CRITICAL = 5, 10, 20, 25, 30, 40, 50
+
+    def __init__(self, manager: "LoggerManager", bound_logger):
+        self._manager = manager
+        self._logger = bound_logger
+
+    def trace(self, message, *args, **kwargs):
+        if self._manager._pre_filter(message, self._TRACE):
+            self._logger.opt(depth=1).trace(message, *args, **kwargs)
+
+    def debug(self, message, *args, **kwargs):
+        if self._manager._pre_filter(message, self._DEBUG):
+            self._logger.opt(depth=1).debug(message, *args, **kwargs)
+
+    def info(self, message, *args, **kwargs):
+        if self._manager._pre_filter(message, self._INFO):
+            self._logger.opt(depth=1).info(message, *args, **kwargs)
+
+    def success(self, message, *args, **kwargs):
+        if self._manager._pre_filter(message, self._SUCCESS):
+            self._logger.opt(depth=1).success(message, *args, **kwargs)
+
+    def warning(self, message, *args, **kwargs):
+        if self._manager._pre_filter(message, self._WARNING):
+            self._logger.opt(depth=1).warning(message, *args, **kwargs)
+
+    def error(self, message, *args, **kwargs):
+        if self._manager._pre_filter(message, self._ERROR):
+            self._logger.opt(depth=1).error(message, *args, **kwargs)
+
+    def critical(self, message, *args, **kwargs):
+        if self._manager._pre_filter(message, self._CRITICAL):
+            self._logger.opt(depth=1).critical(message, *args, **kwargs)
+
+    def exception(self, message, *args, **kwargs):
+        if self._manager._pre_filter(message, self._ERROR):
+            self._logger.opt(depth=1).exception(message, *args, **kwargs)
+
+    def bind(self, **kwargs):
+        return PreFilteredLogger(self._manager, self._logger.bind(**kwargs))
+
+    def __getattr__(self, name):
+        # opt(), contextualize(), log(), ... go straight to loguru
+        return getattr(self._logger, name)
 
 
 class LoggerManager:
@@ -33,6 +471,9 @@ class LoggerManager:
         ... )
     """
 
+    # Log directories already created by any manager in this process
+    _KNOWN_DIRS: set = set()
+
     def __init__(self, *,
                  log_name: str = "app",
                  log_file_path: str = "logs/app.log",
@@ -44,13 +485,15 @@ class LoggerManager:
                  console_level: Optional[str] = None,  # Override console output level
                  enable_print_redirect: bool = False,
                  enable_exception_logging: bool = True,
-                 custom_format: Optional[str] = None,
+                 custom_format: Optional[str] = None,  # Parsed once by loguru when the handler is added
                  colorize: Optional[bool] = None,  # None means True
                  backtrace: Optional[bool] = None,
                  diagnose: Optional[bool] = None,
                  catch_exceptions: bool = True,
                  extra_handlers: Optional[list] = None,
-                 filter_func: Optional[Callable] = None  # Custom filter function
+                 filter_func: Optional[Callable] = None,  # Custom filter function
+                 file_batch_size: int = 100,  # 0 writes every record straight through
+                 file_flush_interval: float = 1.0
                  ):
         self.log_name = log_name
         self.log_file_path = Path(log_file_path)
@@ -84,16 +527,30 @@ class LoggerManager:
         self.catch_exceptions = catch_exceptions
         self.extra_handlers = extra_handlers or []
         self.filter_func = filter_func
+        self._message_blocklist = None  # Compiled search used by _pre_filter
+        self.file_batch_size = file_batch_size
+        self.file_flush_interval = file_flush_interval
+        self._file_sink = None
+
+        # Host name, looked up once for bind() (pid is a property, kept current across forks)
+        self.host = socket.gethostname()
 
         # Store original print function
         self._original_print = builtins.print
         self._print_redirected = False
 
-        # Store handler IDs for cleanup
+        # Store handler IDs for cleanup, with the kwargs each was added with
+        # (kept parallel so handlers can be re-added individually)
         self._handler_ids = []
+        self._handler_specs = []
 
         self._setup_logger()
 
+    @property
+    def pid(self) -> int:
+        """Current process id, without a getpid() call per bind."""
+        return _PID
+
     def _setup_logger(self):
         """Configure the logger with all specified settings."""
         # Remove default handlers
@@ -102,25 +559,26 @@ class LoggerManager:
         # Console output - plain format for both dev and prod (no colors)
         console_format = "{time:YYYY-MM-DD HH:mm:ss} | {level:<5} | {message}"
 
-        handler_id = logger.add(
-            sys.stdout,
+        self._add_handler_spec(dict(
+            sink=sys.stdout,
             level=self.console_level,
             format=console_format,
             colorize=False,  # No colors for console output
             backtrace=self.backtrace,
             diagnose=self.diagnose,
             filter=self.filter_func
-        )
-        self._handler_ids.append(handler_id)
+        ))
 
-        # Create log directory if it doesn't exist
-        self.log_file_path.parent.mkdir(parents=True, exist_ok=True)
+        # Create log directory if it doesn't exist (once per directory per process)
+        log_dir = str(self.log_file_path.parent)
+        if log_dir not in LoggerManager._KNOWN_DIRS:
+            self.log_file_path.parent.mkdir(parents=True, exist_ok=True)
+            LoggerManager._KNOWN_DIRS.add(log_dir)
 
         # File logging format - simplified
         if self.json_format:
-            # Use serialize=True instead of custom formatter for JSON
+            # JSON records are produced by the sink's serializer (see _file_sink_kwargs)
             log_format = "{message}"
-            file_serialize = True
         else:
             # Simplified format for file output
             log_format = self.custom_format or (
@@ -129,29 +587,23 @@ class LoggerManager:
                 "{function}:{line} | "
                 "{message}"
             )
-            file_serialize = False
 
         # Add file handler
-        handler_id = logger.add(
-            sink=self.log_file_path,
+        self._add_handler_spec(dict(
+            **self._file_sink_kwargs(),
             level=self.level,
-            rotation=self.rotation,
-            retention=self.retention,
             format=log_format,
             backtrace=self.backtrace,
             diagnose=self.diagnose,
-            enqueue=True,  # Thread-safe
-            serialize=file_serialize,  # Use JSON serialization if json_format is True
             filter=self.filter_func
-        )
-        self._handler_ids.append(handler_id)
+        ))
 
         # Add extra handlers
         for handler in self.extra_handlers:
-            if 'filter' not in handler and self.filter_func:
-                handler['filter'] = self.filter_func
-            handler_id = logger.add(**handler)
-            self._handler_ids.append(handler_id)
+            spec = dict(handler)
+            if 'filter' not in spec and self.filter_func:
+                spec['filter'] = self.filter_func
+            self._add_handler_spec(spec)
 
         # Redirect print to logger if enabled
         if self.enable_print_redirect:
@@ -162,6 +614,55 @@ class LoggerManager:
             self._setup_exception_logging()
 
 
+    def _file_sink_kwargs(self) -> dict:
+        """
+        Sink kwargs for the main log file.
+
+        Uses a BatchedFileSink when batching is enabled and rotation/retention
+        are size/duration strings it can honour; otherwise loguru's own file sink.
+        Batched JSON lines come from _serialize_record (orjson when available).
+        """
+        rotation = _parse_or_none(parse_size, self.rotation)
+        retention = _parse_or_none(parse_duration, self.retention)
+        batchable = (
+            self.file_batch_size > 0
+            and (self.rotation is None or rotation is not None)
+            and (self.retention is None or retention is not None)
+        )
+        if not batchable:
+            return dict(sink=self.log_file_path, rotation=self.rotation, retention=self.retention,
+                        serialize=self.json_format,
+                        enqueue=True)  # Thread-safe
+
+        if self._file_sink is None:
+            self._file_sink = BatchedFileSink(
+                self.log_file_path,
+                batch_size=self.file_batch_size,
+                flush_interval=self.file_flush_interval,
+                rotation=rotation,
+                retention=retention,
+                serializer=_serialize_record if self.json_format else None
+            )
+        # The sink does its own queueing, so skip loguru's per-record multiprocessing queue
+        return dict(sink=self._file_sink, enqueue=False)
+
+    def _add_handler_spec(self, spec: dict) -> int:
+        """Add a handler and remember its kwargs for in-place re-adding."""
+        handler_id = logger.add(**spec)
+        self._handler_ids.append(handler_id)
+        self._handler_specs.append(spec)
+        return handler_id
+
+    def is_enabled(self, level: str) -> bool:
+        """
+        Check whether a record at `level` would reach any sink.
+
+        Usage:
+            if log_manager.is_enabled("DEBUG"):
+                log.debug("State dump", state=expensive_dump())
+        """
+        return logger.level(level).no >= _min_level_no()
+
     def _redirect_print(self):
         """Redirect print statements to logger."""
         if self._print_redirected:
@@ -169,7 +670,7 @@ class LoggerManager:
 
         def custom_print(*args, **kwargs):
             message = " ".join(map(str, args))
-            logger.opt(depth=1).info(f"[PRINT] {message}")
+            logger.opt(depth=1).info("[PRINT] {}", message)
 
         builtins.print = custom_print
         self._print_redirected = True
@@ -198,15 +699,16 @@ class LoggerManager:
         """
         if 'filter' not in kwargs and self.filter_func:
             kwargs['filter'] = self.filter_func
-        handler_id = logger.add(**kwargs)
-        self._handler_ids.append(handler_id)
+        handler_id = self._add_handler_spec(kwargs)
         return handler_id
 
     def remove_handler(self, handler_id: int):
         """Remove a handler by ID."""
         logger.remove(handler_id)
         if handler_id in self._handler_ids:
-            self._handler_ids.remove(handler_id)
+            index = self._handler_ids.index(handler_id)
+            del self._handler_ids[index]
+            del self._handler_specs[index]
 
     def bind(self, **kwargs):
         """Bind contextual data to logger."""
@@ -220,21 +722,43 @@ class LoggerManager:
         """Configure logger with additional options."""
         logger.configure(**kwargs)
 
-    def get_logger(self):
-        """Get the configured logger instance."""
+    def get_logger(self, prefilter: bool = False):
+        """
+        Get the configured logger instance.
+
+        Args:
+            prefilter: Return a PreFilteredLogger that drops disabled levels and
+                blocklisted messages before loguru builds the record
+
+        Usage:
+            log_manager.set_keyword_blocklist(["password", "token"])
+            log = log_manager.get_logger(prefilter=True)
+            log.info("password reset for {}", user)  # Rejected without building a record
+        """
+        if prefilter:
+            return PreFilteredLogger(self, logger)
         return logger
 
+    def _pre_filter(self, message: Any, level_no: int) -> bool:
+        """Cheap accept/reject check run before any loguru record is built."""
+        if level_no < _min_level_no():
+            return False
+        blocklist = self._message_blocklist
+        return blocklist is None or not isinstance(message, str) or blocklist(message) is None
+
     def flush(self):
         """
         Force flush all log handlers.
         Useful for ensuring all logs are written before shutdown.
         """
-        for handler_id in self._handler_ids:
-            try:
-                # Loguru doesn't have a direct flush method, but we can complete the queue
-                logger.complete()
-            except Exception:
-                pass
+        try:
+            # Loguru doesn't have a direct flush method, but completing the queue
+            # waits for every handler at once
+            logger.complete()
+        except Exception:
+            pass
+        if self._file_sink is not None:
+            self._file_sink.flush()
 
     def log_performance(self, include_args: bool = False, log_exceptions: bool = True) -> Callable:
         """
@@ -255,26 +779,8 @@ class LoggerManager:
         def decorator(func: Callable) -> Callable:
             @wraps(func)
             def wrapper(*args, **kwargs):
-                func_name = func.__name__
-                start_time = datetime.now()
-
-                # Prepare argument string if needed
-                arg_str = ""
-                if include_args:
-                    arg_list = [repr(arg) for arg in args]
-                    kwarg_list = [f"{k}={repr(v)}" for k, v in kwargs.items()]
-                    arg_str = f" with args: ({', '.join(arg_list + kwarg_list)})"
-
-                try:
-                    result = func(*args, **kwargs)
-                    duration = (datetime.now() - start_time).total_seconds()
-                    logger.info(f"Function '{func_name}'{arg_str} executed successfully in {duration:.3f} seconds")
-                    return result
-                except Exception as e:
-                    duration = (datetime.now() - start_time).total_seconds()
-                    if log_exceptions:
-                        logger.exception(f"Function '{func_name}'{arg_str} failed after {duration:.3f} seconds")
-                    raise
+                return log_timed_call(func, args, kwargs,
+                                      include_args=include_args, log_exceptions=log_exceptions)
 
             return wrapper
 
@@ -296,10 +802,46 @@ class LoggerManager:
                 return "password" not in record["message"].lower()
             log_manager.set_filter(my_filter)
         """
+        old_filter = self.filter_func
         self.filter_func = filter_func
-        # Re-setup logger with new filter
-        self.cleanup()
-        self._setup_logger()
+        self._message_blocklist = None
+
+        if not self._handler_ids:
+            # Nothing configured (e.g. after cleanup) - build from scratch
+            self._setup_logger()
+            return
+
+        # Re-add only the handlers using the manager-wide filter, keeping
+        # print redirection, log directory and other handlers untouched
+        for index, spec in enumerate(self._handler_specs):
+            if spec.get('filter') is not old_filter:
+                continue  # Handler has its own filter
+            spec['filter'] = filter_func
+            try:
+                logger.remove(self._handler_ids[index])
+            except ValueError:
+                pass  # Handler already removed
+            self._handler_ids[index] = logger.add(**spec)
+
+    def set_keyword_blocklist(self, keywords: list):
+        """
+        Drop records whose message contains any of the keywords (case-insensitive).
+
+        The keywords are compiled into a single regex, so each record is scanned
+        once instead of once per keyword.
+
+        Usage:
+            log_manager.set_keyword_blocklist(["password", "token", "secret"])
+        """
+        pattern = re.compile("|".join(re.escape(k) for k in keywords), re.IGNORECASE)
+        search = pattern.search
+
+        def keyword_filter(record):
+            return search(record["message"]) is None
+
+        self.set_filter(keyword_filter)
+        # Also lets prefiltered loggers reject matching messages up front
+        self._message_blocklist = search
 
     def cleanup(self):
         """Clean up all handlers and restore print if needed."""
@@ -310,6 +852,12 @@ class LoggerManager:
             except ValueError:
                 pass  # Handler already removed
         self._handler_ids.clear()
+        self._handler_specs.clear()
+
+        # Write out anything still batched and release the file
+        if self._file_sink is not None:
+            self._file_sink.stop()
+            self._file_sink = None
 
         # Restore print
         self.restore_print()
@@ -434,11 +982,7 @@ if __name__ == "__main__":
 
 
         # Filter example
-        def no_password_filter(record):
-            return "password" not in record["message"].lower()
-
-
-        log_manager.set_filter(no_password_filter)
+        log_manager.set_keyword_blocklist(["password"])
         log.info("User logged in with password: secret123")  # This won't be logged
         log.info("User logged in successfully")  # This will be logged
 
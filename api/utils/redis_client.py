@@ -9,12 +9,29 @@ pool = ConnectionPool(
     db=Config.REDIS_DB,
     password=Config.REDIS_PASSWORD,
     max_connections=10,  # Limited connections for resource constraints
-    decode_responses=True
+    decode_responses=True,
+    socket_keepalive=True,  # Keep idle pooled connections alive
+    # Fail fast when the server is unreachable; no read timeout (socket_timeout),
+    # since the shared pool also serves blocking commands (BLPOP, XREAD BLOCK, pubsub)
+    socket_connect_timeout=5,
+    health_check_interval=30  # Re-validate connections idle for 30s before reuse
 )
 
 def get_redis_client():
     """Get Redis client instance from pool"""
     return redis.Redis(connection_pool=pool)
 
-# Global redis client
-redis_client = get_redis_client()
\ No newline at end of file
+class _LazyRedis:
+    """Proxy that creates the Redis client on first attribute access"""
+    _client = None
+
+    def _real(self):
+        if self._client is None:
+            self._client = get_redis_client()
+        return self._client
+
+    def __getattr__(self, name):
+        return getattr(self._real(), name)
+
+# Global redis client (created on first use)
+redis_client = _LazyRedis()
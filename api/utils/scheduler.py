@@ -4,11 +4,20 @@ This module handles all scheduled background tasks with centralized logging.
 """
 import os
 import atexit
+import json
 from datetime import datetime
 from apscheduler.schedulers.background import BackgroundScheduler
-from apscheduler.events import EVENT_JOB_EXECUTED, EVENT_JOB_ERROR, EVENT_JOB_MISSED
+from apscheduler.events import (
+    EVENT_JOB_EXECUTED, EVENT_JOB_ERROR, EVENT_JOB_MISSED,
+    EVENT_JOB_REMOVED, EVENT_ALL_JOBS_REMOVED
+)
 from .app_logger import get_app_logger, get_task_logger
 
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the stdlib json module
+    orjson = None
+
 # Get the main application logger
 logger = get_app_logger()
 
@@ -18,6 +27,8 @@ class SchedulerManager:
     def __init__(self):
         self.scheduler = None
         self._initialized = False
+        # Job names by id, so listeners don't query the jobstore under its lock
+        self._job_name_by_id = {}
         
     def init_scheduler(self):
         """Initialize the scheduler with proper configuration"""
@@ -50,6 +61,10 @@ class SchedulerManager:
                 self._job_missed_listener,
                 EVENT_JOB_MISSED
             )
+            self.scheduler.add_listener(
+                self._job_removed_listener,
+                EVENT_JOB_REMOVED | EVENT_ALL_JOBS_REMOVED
+            )
             
             # Start the scheduler
             self.scheduler.start()
@@ -58,8 +73,10 @@ class SchedulerManager:
             # Register cleanup on exit
             atexit.register(self.shutdown)
             
+            # Count from the id->name map kept by add_job and the removed
+            # listener, instead of materializing every Job from the jobstore
             logger.success("Scheduler initialized successfully", 
-                         jobs_count=len(self.scheduler.get_jobs()))
+                         jobs_count=len(self._job_name_by_id))
             
             return self.scheduler
             
@@ -67,35 +84,50 @@ class SchedulerManager:
             logger.exception("Failed to initialize scheduler")
             raise
     
+    def _job_name(self, job_id):
+        """Look up a job's name, falling back to the jobstore for jobs added elsewhere"""
+        job_name = self._job_name_by_id.get(job_id)
+        if job_name is None:
+            job = self.scheduler.get_job(job_id)
+            job_name = job.name if job else None
+        return job_name
+    
     def _job_executed_listener(self, event):
         """Log successful job execution"""
-        job = self.scheduler.get_job(event.job_id)
-        if job:
+        job_name = self._job_name(event.job_id)
+        if job_name:
             logger.info("Scheduled job executed successfully",
                        job_id=event.job_id,
-                       job_name=job.name,
+                       job_name=job_name,
                        scheduled_time=event.scheduled_run_time,
                        execution_time=datetime.now())
     
     def _job_error_listener(self, event):
         """Log job execution errors"""
-        job = self.scheduler.get_job(event.job_id)
-        if job:
+        job_name = self._job_name(event.job_id)
+        if job_name:
             logger.error("Scheduled job failed with error",
                         job_id=event.job_id,
-                        job_name=job.name,
+                        job_name=job_name,
                         exception=str(event.exception),
                         traceback=event.traceback)
     
     def _job_missed_listener(self, event):
         """Log missed job executions"""
-        job = self.scheduler.get_job(event.job_id)
-        if job:
+        job_name = self._job_name(event.job_id)
+        if job_name:
             logger.warning("Scheduled job execution missed",
                           job_id=event.job_id,
-                          job_name=job.name,
+                          job_name=job_name,
                           scheduled_time=event.scheduled_run_time)
     
+    def _job_removed_listener(self, event):
+        """Forget names of removed jobs"""
+        if event.code == EVENT_ALL_JOBS_REMOVED:
+            self._job_name_by_id.clear()
+        else:
+            self._job_name_by_id.pop(event.job_id, None)
+    
     def add_job(self, func, trigger, **kwargs):
         """
         Add a job to the scheduler with automatic logging wrapper
@@ -108,44 +140,59 @@ class SchedulerManager:
         # Get job name from function or kwargs
         job_name = kwargs.get('name', func.__name__)
         
+        # Task logger is resolved once here, not on every run
+        task_logger = get_task_logger(job_name)
+        
         # Create a wrapper that adds logging context
         def logged_job_wrapper():
-            task_logger = get_task_logger(job_name)
-            task_logger.info(f"Starting scheduled task: {job_name}")
+            # Positional args are only formatted when the level is enabled
+            task_logger.info("Starting scheduled task: {}", job_name)
             
             try:
                 result = func()
-                task_logger.success(f"Completed scheduled task: {job_name}")
+                task_logger.success("Completed scheduled task: {}", job_name)
                 return result
             except Exception as e:
-                task_logger.exception(f"Error in scheduled task: {job_name}")
+                task_logger.exception("Error in scheduled task: {}", job_name)
                 raise
         
         # Add the wrapped job
         kwargs['name'] = job_name
         job = self.scheduler.add_job(logged_job_wrapper, trigger, **kwargs)
+        self._job_name_by_id[job.id] = job_name
         
-        logger.info(f"Added scheduled job: {job_name}",
+        logger.info("Added scheduled job: {job_name}",
+                   job_name=job_name,
                    trigger=trigger,
                    job_id=job.id,
                    next_run=job.next_run_time)
         
         return job
     
-    def get_jobs_status(self):
-        """Get status of all scheduled jobs"""
+    def iter_jobs_status(self):
+        """Yield a status dict per scheduled job (next_run stays a datetime)"""
         if not self.scheduler:
-            return {"status": "not_initialized", "jobs": []}
+            return
         
-        jobs = []
         for job in self.scheduler.get_jobs():
-            jobs.append({
+            yield {
                 "id": job.id,
                 "name": job.name,
                 "trigger": str(job.trigger),
-                "next_run": job.next_run_time.isoformat() if job.next_run_time else None,
+                "next_run": job.next_run_time,
                 "pending": job.pending
-            })
+            }
+    
+    def get_jobs_status(self):
+        """Get status of all scheduled jobs"""
+        if not self.scheduler:
+            return {"status": "not_initialized", "jobs": []}
+        
+        jobs = []
+        for job in self.iter_jobs_status():
+            next_run = job["next_run"]
+            job["next_run"] = next_run.isoformat() if next_run else None
+            jobs.append(job)
         
         return {
             "status": "running" if self.scheduler.running else "stopped",
@@ -153,6 +200,25 @@ class SchedulerManager:
             "jobs": jobs
         }
     
+    def get_jobs_status_json(self) -> bytes:
+        """
+        Get status of all scheduled jobs serialized as JSON bytes
+        Datetimes are encoded by the serializer, skipping per-job isoformat() calls
+        """
+        if not self.scheduler:
+            status = {"status": "not_initialized", "jobs": []}
+        else:
+            jobs = list(self.iter_jobs_status())
+            status = {
+                "status": "running" if self.scheduler.running else "stopped",
+                "jobs_count": len(jobs),
+                "jobs": jobs
+            }
+        
+        if orjson is not None:
+            return orjson.dumps(status, option=orjson.OPT_NAIVE_UTC)
+        return json.dumps(status, default=lambda value: value.isoformat()).encode()
+    
     def shutdown(self, wait=True):
         """Shutdown the scheduler gracefully"""
         if self.scheduler and self.scheduler.running:
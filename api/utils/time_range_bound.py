@@ -1,62 +1,230 @@
-from datetime import datetime, date, time
-from typing import Union, Dict, Optional, Tuple
-from elasticsearch import Elasticsearch
-from elasticsearch_dsl import Q, Search
+import re
+from collections import namedtuple
+from datetime import datetime, date, timedelta, timezone
+from functools import lru_cache
+from typing import TYPE_CHECKING, Union, Dict, Iterable, List, Optional, Tuple
 
+# elasticsearch / elasticsearch_dsl are imported where they're used, so the
+# parsing helpers don't pay for their import
+if TYPE_CHECKING:
+    from elasticsearch_dsl import MultiSearch, Q, Search
 
-def parse_time_input(time_input: Union[str, datetime, date]) -> datetime:
-    if isinstance(time_input, datetime):
-        return time_input
+
+# Range operators for the start and end bound of each inclusive mode
+_INCL = {
+    'both': ('gte', 'lte'),
+    'start': ('gte', 'lt'),
+    'end': ('gt', 'lte'),
+    'neither': ('gt', 'lt'),
+}
+
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MS = timedelta(milliseconds=1)
+
+# Covers all three accepted layouts, padded or not, in one match; ASCII digits
+# only, as strptime accepted
+_TS_RE = re.compile(r'([0-9]{4})-([0-9]{1,2})-([0-9]{1,2})(?:(?:T|\s+)([0-9]{1,2}):([0-9]{1,2})(?::([0-9]{1,2}))?)?')
+
+
+@lru_cache(maxsize=4096)
+def _parse_str(time_input: str) -> datetime:
+    # Same strings recur across queries; datetimes are immutable, so sharing is safe
+    n = len(time_input)
+    if time_input[4:5] == '-' and time_input[7:8] == '-' and (
+            n == 10 or (n in (16, 19) and time_input[10] in ' T' and time_input[13] == ':'
+                        and (n == 16 or time_input[16] == ':'))):
+        # Padded layouts parse in C; the shape check keeps out the extra forms
+        # fromisoformat accepts (week dates, offsets, any separator)
+        try:
+            return datetime.fromisoformat(time_input)
+        except ValueError:
+            pass
+    m = _TS_RE.fullmatch(time_input)
+    if m:
+        y, mo, d, h, mi, sec = m.groups()
+        try:
+            return datetime(int(y), int(mo), int(d), int(h or 0), int(mi or 0), int(sec or 0))
+        except ValueError:
+            # Out-of-range field (month 13, Feb 30, hour 24): strptime rejects it too
+            raise ValueError(f"Unable to parse time string: {time_input}") from None
+    # Last resort for strptime-only quirks (e.g. space-padded fields)
+    for fmt in ['%Y-%m-%d %H:%M:%S', '%Y-%m-%d %H:%M', '%Y-%m-%d']:
+        try:
+            return datetime.strptime(time_input, fmt)
+        except ValueError:
+            continue
+    raise ValueError(f"Unable to parse time string: {time_input}")
+
+
+def _parse_time_input(time_input: Union[str, datetime, date]) -> Tuple[datetime, bool]:
+    # Also reports whether the input named a whole day (a date or 10-char string)
+    if type(time_input) is str:
+        # Most common input: exact type check, no isinstance MRO walk
+        return _parse_str(time_input), len(time_input) == 10
+    elif isinstance(time_input, datetime):
+        return time_input, False
     elif isinstance(time_input, date):
-        return datetime.combine(time_input, time.min)
+        return datetime(time_input.year, time_input.month, time_input.day), True
     elif isinstance(time_input, str):
-        for fmt in ['%Y-%m-%d %H:%M:%S', '%Y-%m-%d %H:%M', '%Y-%m-%d']:
-            try:
-                return datetime.strptime(time_input, fmt)
-            except ValueError:
-                continue
-        raise ValueError(f"Unable to parse time string: {time_input}")
+        return _parse_str(time_input), len(time_input) == 10
     else:
         raise TypeError(f"Unsupported time input type: {type(time_input)}")
 
 
+def parse_time_input(time_input: Union[str, datetime, date]) -> datetime:
+    return _parse_time_input(time_input)[0]
+
+
+@lru_cache(maxsize=None)
+def _pandas():
+    # Imported on first bulk parse: pandas costs far more to import than this
+    # whole module, and a missing install is only looked up once
+    try:
+        import pandas
+    except ImportError:  # Optional: parse_time_inputs falls back to per-item parsing
+        return None
+    return pandas
+
+
+def parse_time_inputs(time_inputs: Iterable[Union[str, datetime, date]]) -> List[datetime]:
+    values = list(time_inputs)
+    if not values:
+        return []
+    pd = _pandas()
+    if pd is None:
+        return [parse_time_input(v) for v in values]
+
+    # Vectorized pass over the full-timestamp strings only; anything it can't
+    # read (other formats, dates, datetimes) comes back NaT and goes through
+    # parse_time_input, so results match the scalar parser exactly
+    parsed = pd.to_datetime(pd.Series([v if type(v) is str else None for v in values], dtype=object),
+                            format='%Y-%m-%d %H:%M:%S', errors='coerce', cache=True)
+    return [parse_time_input(v) if ts is pd.NaT else ts.to_pydatetime()
+            for v, ts in zip(values, parsed)]
+
+
+_Bounds = namedtuple('_Bounds', 'start end')
+
+
 def get_time_range_bounds(start: Union[str, datetime, date, None] = None,
                           end: Union[str, datetime, date, None] = None,
                           inclusive: str = 'both') -> Tuple[Optional[datetime], Optional[datetime]]:
+    return _bounds_cached(_query_key(start), _query_key(end))
+
+
+@lru_cache(maxsize=1024)
+def _bounds_cached(start_key, end_key) -> _Bounds:
+    # Bounds don't depend on inclusive, so it stays out of the key; the
+    # immutable _Bounds is handed to every caller with equal inputs
+    start, end = _key_value(start_key), _key_value(end_key)
     start_dt = parse_time_input(start) if start else None
-    end_dt = parse_time_input(end) if end else None
+    end_dt = None
+
+    if end:
+        end_dt, end_date_only = _parse_time_input(end)
+        if end_date_only:
+            end_dt = datetime(end_dt.year, end_dt.month, end_dt.day, 23, 59, 59, 999999)
+
+    return _Bounds(start_dt, end_dt)
+
+
+def _query_key(value: Union[str, datetime, date, None]):
+    # Dates share cache entries with their 'YYYY-MM-DD' string (same bounds);
+    # datetimes are hashable as-is and keep tzinfo/microseconds that an ISO
+    # string round-trip through parse_time_input would not
+    t = type(value)
+    if t is str:
+        return value or None
+    if t is datetime or isinstance(value, datetime):
+        # Aware datetimes for the same instant in different zones compare (and
+        # hash) equal, so the zone goes into the key: each caller must get
+        # bounds in its own tzinfo, and round_to rounds in that zone
+        return value if value.tzinfo is None else (value, value.tzinfo)
+    if t is date or isinstance(value, date):
+        return value.isoformat()
+    return value or None
 
-    if end_dt and isinstance(end, (str, date)) and not isinstance(end, datetime):
-        if len(str(end)) == 10 or isinstance(end, date):
-            end_dt = datetime.combine(end_dt.date(), time.max)
 
-    return start_dt, end_dt
+def _key_value(key):
+    """Undo _query_key's (datetime, tzinfo) wrapping."""
+    return key[0] if type(key) is tuple else key
+
+
+def _round_bound(dt: datetime, step: timedelta, up: bool) -> datetime:
+    rem = (dt - datetime(1970, 1, 1, tzinfo=dt.tzinfo)) % step
+    if not rem:
+        return dt
+    return dt + (step - rem) if up else dt - rem
+
+
+def _epoch_millis(dt: datetime, round_up: bool) -> int:
+    # Naive datetimes count as UTC, as Elasticsearch read the offset-less ISO
+    # strings sent before; sub-millisecond parts round toward the inside of
+    # the range so millisecond-precision fields match exactly as before
+    ms, rem = divmod(dt - (_EPOCH if dt.tzinfo is None else _EPOCH_UTC), _MS)
+    return ms + 1 if round_up and rem else ms
 
 
 def build_time_range_query(field: str,
                            start: Union[str, datetime, date, None] = None,
                            end: Union[str, datetime, date, None] = None,
-                           inclusive: str = 'both') -> Q:
-    start_dt, end_dt = get_time_range_bounds(start, end, inclusive)
+                           inclusive: str = 'both',
+                           round_to: Optional[timedelta] = None) -> "Q":
+    from elasticsearch_dsl import Q
+
+    # Only the parsed params are cached; each call gets its own Q and params
+    # dict, since Q.to_dict() hands out the inner dict by reference
+    range_params = _range_params_cached(_query_key(start), _query_key(end), inclusive, round_to)
+    return Q('range', **{field: dict(range_params)})
 
+
+def build_time_range_dict(field: str,
+                          start: Union[str, datetime, date, None] = None,
+                          end: Union[str, datetime, date, None] = None,
+                          inclusive: str = 'both',
+                          round_to: Optional[timedelta] = None) -> Dict:
+    # Plain {'range': ...} clause for raw request bodies; no DSL objects involved
+    range_params = _range_params_cached(_query_key(start), _query_key(end), inclusive, round_to)
+    return {'range': {field: dict(range_params)}}
+
+
+@lru_cache(maxsize=1024)
+def _range_params_cached(start_key: Union[str, datetime, None],
+                         end_key: Union[str, datetime, None],
+                         inclusive: str,
+                         round_to: Optional[timedelta] = None) -> Dict[str, Union[int, str]]:
+    # Shared between cache hits: callers copy before handing it out
+    try:
+        start_op, end_op = _INCL[inclusive]
+    except KeyError:
+        raise ValueError(f"Invalid inclusive value: {inclusive}") from None
+
+    start_dt, end_dt = _bounds_cached(start_key, end_key)
+
+    # Widen to whole round_to steps (start down, end up) so repeated queries
+    # send identical bounds and can hit the shard request cache
+    if round_to:
+        if start_dt:
+            start_dt = _round_bound(start_dt, round_to, up=False)
+        if end_dt:
+            end_dt = _round_bound(end_dt, round_to, up=True)
+
+    # Integer epoch_millis bounds skip the server-side date parse per shard
     range_params = {}
 
     if start_dt:
-        if inclusive in ['both', 'start']:
-            range_params['gte'] = start_dt.isoformat()
-        else:
-            range_params['gt'] = start_dt.isoformat()
+        range_params[start_op] = _epoch_millis(start_dt, round_up=start_op == 'gte')
 
     if end_dt:
-        if inclusive in ['both', 'end']:
-            range_params['lte'] = end_dt.isoformat()
-        else:
-            range_params['lt'] = end_dt.isoformat()
+        range_params[end_op] = _epoch_millis(end_dt, round_up=end_op == 'lt')
 
     if not range_params:
         raise ValueError("At least one of start or end must be provided")
 
-    return Q('range', **{field: range_params})
+    range_params['format'] = 'epoch_millis'
+
+    return range_params
 
 
 def search_with_time_range(es_client,
@@ -65,47 +233,65 @@ def search_with_time_range(es_client,
                            start: Union[str, datetime, date, None] = None,
                            end: Union[str, datetime, date, None] = None,
                            additional_filters: Optional[Dict] = None,
-                           size: int = 100) -> Search:
-    s = Search(using=es_client, index=index)
+                           size: int = 100,
+                           round_to: Optional[timedelta] = None) -> "Search":
+    from elasticsearch_dsl import Q
 
-    time_query = build_time_range_query(time_field, start, end)
-    s = s.filter(time_query)
+    s = _search_proto(index, size).using(es_client)
 
+    # One bool query with every filter clause: a single Search clone instead of one per filter
+    filters = [build_time_range_query(time_field, start, end, round_to=round_to)]
     if additional_filters:
-        for field, value in additional_filters.items():
-            s = s.filter('term', **{field: value})
+        filters.extend(Q('term', **{field: value}) for field, value in additional_filters.items())
+    # using()/query()/sort() clone, so the cached prototype is never modified. The sort
+    # dict is built per call: Search.to_dict() returns it by reference
+    s = s.query('bool', filter=filters)
+    return s.sort({time_field: {'order': 'desc'}})
+
 
-    s = s.params(size=size)
-    s = s.sort({time_field: {'order': 'desc'}})
+@lru_cache(maxsize=64)
+def _search_proto(index: str, size: int) -> "Search":
+    # No client in the key or the prototype: caching the client would keep
+    # discarded clients and their connection pools alive
+    from elasticsearch_dsl import Search
 
-    return s
+    return Search(index=index).params(size=size)
 
 
+def search_with_time_range_batch(es_client, searches: List[Dict]) -> "MultiSearch":
+    # Each entry holds search_with_time_range keyword arguments; executing the
+    # result costs one _msearch round-trip and returns responses in order
+    from elasticsearch_dsl import MultiSearch
 
+    ms = MultiSearch(using=es_client)
+    for params in searches:
+        ms = ms.add(search_with_time_range(es_client, **params))
+    return ms
 
-es = Elasticsearch(['http://localhost:9200'])
 
-results = search_with_time_range(
-    es,
-    index='your_index',
-    time_field='timestamp',
-    start='2024-01-01',
-    end='2024-01-31 23:59:59'
-).execute()
+if __name__ == "__main__":
+    from elasticsearch import Elasticsearch
 
-results = search_with_time_range(
-    es,
-    index='your_index',
-    time_field='created_at',
-    start=datetime(2024, 1, 1, 9, 0),
-    end=date(2024, 1, 31)
-).execute()
+    es = Elasticsearch(['http://localhost:9200'])
 
-results = search_with_time_range(
-    es,
-    index='your_index',
-    time_field='updated_at',
-    start='2024-01-15',
-    end='2024-01-15',
-    additional_filters={'status': 'active'}
-).execute()
\ No newline at end of file
+    results = search_with_time_range_batch(es, [
+        dict(
+            index='your_index',
+            time_field='timestamp',
+            start='2024-01-01',
+            end='2024-01-31 23:59:59'
+        ),
+        dict(
+            index='your_index',
+            time_field='created_at',
+            start=datetime(2024, 1, 1, 9, 0),
+            end=date(2024, 1, 31)
+        ),
+        dict(
+            index='your_index',
+            time_field='updated_at',
+            start='2024-01-15',
+            end='2024-01-15',
+            additional_filters={'status': 'active'}
+        ),
+    ]).execute()